@@ -0,0 +1,117 @@
+import hashlib
+import logging
+import os
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
+from starlette.datastructures import Headers, MutableHeaders
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+CACHE_PREFIX = "library-cache"
+
+BOOKS_NAMESPACE = "books"
+AUTHORS_NAMESPACE = "authors"
+
+logger = logging.getLogger(__name__)
+
+def init_cache():
+    redis = aioredis.from_url(REDIS_URL)
+    FastAPICache.init(RedisBackend(redis), prefix=CACHE_PREFIX)
+    return redis
+
+def book_cache_key(book_id: int) -> str:
+    return f"{CACHE_PREFIX}:{BOOKS_NAMESPACE}:book:{book_id}"
+
+def author_books_cache_key(author_id: int) -> str:
+    return f"{CACHE_PREFIX}:{BOOKS_NAMESPACE}:author_books:{author_id}"
+
+# Ключи кэша строятся только из параметров запроса, без сессии БД
+def list_key_builder(func, namespace, *, request=None, response=None, args, kwargs):
+    return f"{namespace}:list:{kwargs['cursor']}:{kwargs['limit']}"
+
+def book_key_builder(func, namespace, *, request=None, response=None, args, kwargs):
+    return book_cache_key(kwargs["book_id"])
+
+def author_books_key_builder(func, namespace, *, request=None, response=None, args, kwargs):
+    return author_books_cache_key(kwargs["author_id"])
+
+def search_key_builder(func, namespace, *, request=None, response=None, args, kwargs):
+    return f"{namespace}:search:{kwargs['title'].lower()}"
+
+async def invalidate(*keys: str):
+    """
+    Удаляет из кэша конкретные ключи после записи
+
+    Списки и результаты поиска не сбрасываются: очистка по пространству имен
+    требует сканирования всех ключей Redis, поэтому они устаревают по TTL.
+    """
+    for key in keys:
+        # Недоступный Redis не должен ломать уже закоммиченную запись
+        try:
+            await FastAPICache.get_backend().clear(key=key)
+        except Exception:
+            logger.warning("Failed to clear cache key '%s'", key, exc_info=True)
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    # Прокси (например, nginx с gzip) превращают сильный ETag в слабый W/"..."
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+class ETagMiddleware:
+    """
+    HTTP-кэширование GET-ответов API
+
+    Проставляет ETag (хэш тела ответа) и Cache-Control для успешных ответов
+    на пути из paths и отвечает 304 Not Modified, если клиент прислал
+    совпадающий If-None-Match (слабое сравнение, как в RFC 9110, и `*`).
+    ETag считается по готовому телу, поэтому обработчик выполняется всегда:
+    304 экономит передачу тела, а от запроса к БД избавляет только кэш Redis.
+    """
+
+    def __init__(self, app, paths=("/books", "/authors"), max_age: int = 30):
+        self.app = app
+        self.paths = tuple(paths)
+        self.max_age = max_age
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or not scope["path"].startswith(self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        body = []
+
+        async def send_with_etag(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            body.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                await self.send_response(scope, start_message, b"".join(body), send)
+
+        await self.app(scope, receive, send_with_etag)
+
+    async def send_response(self, scope, start_message, body, send):
+        if start_message["status"] == 200:
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            headers = MutableHeaders(scope=start_message)
+            headers["ETag"] = etag
+            headers["Cache-Control"] = f"public, max-age={self.max_age}"
+
+            if_none_match = Headers(scope=scope).get("if-none-match", "")
+            if etag_matches(etag, if_none_match):
+                del headers["content-length"]
+                del headers["content-type"]
+                start_message["status"] = 304
+                body = b""
+
+        await send(start_message)
+        await send({"type": "http.response.body", "body": body})
@@ -1,17 +1,38 @@
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from ..models.author import Author
+from ..models.book import Book
 from ..schemas.author import AuthorCreate
+from .pagination import encode_cursor, decode_cursor
 
-def get_authors(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Author).offset(skip).limit(limit).all()
+async def get_authors(db: AsyncSession, cursor: Optional[str] = None, limit: int = 100):
+    last_id = decode_cursor(cursor)
+    page_size = limit + 1
+    stmt = lambda_stmt(
+        lambda: select(Author).options(defer(Author.bio, raiseload=True))
+    )
+    stmt += lambda s: s.where(Author.id > last_id).order_by(Author.id).limit(page_size)
+    result = await db.execute(stmt)
+    authors = result.scalars().all()
+    next_cursor = None
+    if len(authors) > limit:
+        authors = authors[:limit]
+        next_cursor = encode_cursor(authors[-1].id)
+    return authors, next_cursor
 
-def get_author_books(db: Session, author_id: int):
-    author = db.query(Author).filter(Author.id == author_id).first()
-    return author.books if author else []
+async def get_author_books(db: AsyncSession, author_id: int):
+    stmt = lambda_stmt(lambda: select(Book))
+    stmt += lambda s: s.where(Book.author_id == author_id).order_by(Book.id)
+    result = await db.execute(stmt)
+    books = result.scalars().all()
+    if not books and await db.get(Author, author_id) is None:
+        return None
+    return books
 
-def create_author(db: Session, author: AuthorCreate):
-    db_author = Author(**author.dict())
+async def create_author(db: AsyncSession, author: AuthorCreate):
+    db_author = Author(**author.model_dump())
     db.add(db_author)
-    db.commit()
-    db.refresh(db_author)
+    await db.commit()
     return db_author
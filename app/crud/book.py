@@ -1,37 +1,103 @@
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from sqlalchemy import select, insert, func, lambda_stmt
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, defer
+from ..models.author import Author
 from ..models.book import Book
 from ..schemas.book import BookCreate, BookUpdate
+from .pagination import encode_cursor, decode_cursor
+from ..caching import invalidate, book_cache_key, author_books_cache_key
 
-def get_books(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Book).offset(skip).limit(limit).all()
+async def get_books(db: AsyncSession, cursor: Optional[str] = None, limit: int = 100):
+    last_id = decode_cursor(cursor)
+    page_size = limit + 1
+    stmt = lambda_stmt(
+        lambda: select(Book).options(
+            selectinload(Book.author).defer(Author.bio, raiseload=True),
+            defer(Book.description, raiseload=True),
+        )
+    )
+    stmt += lambda s: s.where(Book.id > last_id).order_by(Book.id).limit(page_size)
+    result = await db.execute(stmt)
+    books = result.scalars().all()
+    next_cursor = None
+    if len(books) > limit:
+        books = books[:limit]
+        next_cursor = encode_cursor(books[-1].id)
+    return books, next_cursor
 
-def get_book(db: Session, book_id: int):
-    return db.query(Book).filter(Book.id == book_id).first()
+async def get_book(db: AsyncSession, book_id: int):
+    return await db.get(Book, book_id)
 
-def create_book(db: Session, book: BookCreate):
-    db_book = Book(**book.dict())
+async def create_book(db: AsyncSession, book: BookCreate):
+    db_book = Book(**book.model_dump())
     db.add(db_book)
-    db.commit()
-    db.refresh(db_book)
+    await db.commit()
+    await invalidate(author_books_cache_key(db_book.author_id))
     return db_book
 
-def update_book(db: Session, book_id: int, book: BookUpdate):
-    db_book = db.query(Book).filter(Book.id == book_id).first()
+async def create_books_bulk(db: AsyncSession, books: List[BookCreate]):
+    if not books:
+        return []
+    result = await db.scalars(
+        insert(Book).returning(Book, sort_by_parameter_order=True),
+        [book.model_dump() for book in books],
+    )
+    db_books = result.all()
+    await db.commit()
+    author_ids = {db_book.author_id for db_book in db_books}
+    await invalidate(*(author_books_cache_key(author_id) for author_id in author_ids))
+    return db_books
+
+async def update_book(db: AsyncSession, book_id: int, book: BookUpdate):
+    db_book = await db.get(Book, book_id)
     if db_book:
-        update_data = book.dict(exclude_unset=True)
+        old_author_id = db_book.author_id
+        update_data = book.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_book, field, value)
-        db.commit()
-        db.refresh(db_book)
+        await db.commit()
+        await invalidate(
+            book_cache_key(book_id),
+            author_books_cache_key(old_author_id),
+            author_books_cache_key(db_book.author_id),
+        )
     return db_book
 
-def delete_book(db: Session, book_id: int):
-    db_book = db.query(Book).filter(Book.id == book_id).first()
+async def delete_book(db: AsyncSession, book_id: int):
+    db_book = await db.get(Book, book_id)
     if db_book:
-        db.delete(db_book)
-        db.commit()
+        await db.delete(db_book)
+        await db.commit()
+        await invalidate(book_cache_key(book_id), author_books_cache_key(db_book.author_id))
         return True
     return False
 
-def search_books_by_title(db: Session, title: str):
-    return db.query(Book).filter(Book.title.ilike(f"%{title}%")).all()
+def escape_like(value: str) -> str:
+    # Пользовательские % и _ ищутся буквально, а не как шаблоны LIKE
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+async def search_books_by_title(db: AsyncSession, title: str):
+    pattern = f"%{escape_like(title)}%"
+    stmt = lambda_stmt(
+        lambda: select(Book).options(
+            selectinload(Book.author).defer(Author.bio, raiseload=True)
+        )
+    )
+    stmt += lambda s: s.where(Book.title.ilike(pattern, escape="\\")).order_by(Book.id)
+    result = await db.execute(stmt)
+    books = result.scalars().all()
+    if not books and db.bind.dialect.name == "postgresql":
+        books = await search_books_by_similarity(db, title)
+    return books
+
+async def search_books_by_similarity(db: AsyncSession, title: str, limit: int = 50):
+    similarity = func.similarity(Book.title, title)
+    result = await db.execute(
+        select(Book)
+        .options(selectinload(Book.author).defer(Author.bio, raiseload=True))
+        .where(Book.title.op("%")(title))
+        .order_by(similarity.desc())
+        .limit(limit)
+    )
+    return result.scalars().all()
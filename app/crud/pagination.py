@@ -0,0 +1,19 @@
+import base64
+from typing import Optional
+
+# Курсор хранит id последней строки; id — INTEGER в БД
+MAX_CURSOR_ID = 2**31 - 1
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    try:
+        last_id = int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    if not 0 <= last_id <= MAX_CURSOR_ID:
+        raise ValueError("Invalid cursor")
+    return last_id
@@ -0,0 +1,452 @@
+from fastapi import FastAPI, Depends, HTTPException, Path, Query, status, Response
+from fastapi.responses import FileResponse, ORJSONResponse
+from fastapi.openapi.utils import get_openapi
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi_cache.decorator import cache
+from contextlib import asynccontextmanager
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from pydantic import TypeAdapter
+
+from .database.session import get_db, engine
+from .caching import (
+    init_cache,
+    BOOKS_NAMESPACE,
+    AUTHORS_NAMESPACE,
+    list_key_builder,
+    book_key_builder,
+    author_books_key_builder,
+    search_key_builder,
+    ETagMiddleware,
+)
+from .models.book import Book
+from .models.author import Author
+from .schemas.book import BookCreate, BookResponse, BookUpdate, BookPage, BookListItem
+from .schemas.author import AuthorCreate, AuthorResponse, AuthorPage, AuthorListItem
+from .crud.book import (
+    get_books, 
+    get_book, 
+    create_book, 
+    create_books_bulk,
+    update_book,
+    delete_book,
+    search_books_by_title
+)
+from .crud.author import get_authors, get_author_books, create_author
+
+# Кастомная конфигурация OpenAPI для улучшенной ReDoc документации
+def custom_openapi():
+    if app.openapi_schema:
+        return app.openapi_schema
+    
+    openapi_schema = get_openapi(
+        title="Library Management API",
+        version="1.0.0",
+        description="""
+        ## 📚 REST API для системы управления библиотекой
+        
+        Полнофункциональное API для управления книгами и авторами в библиотеке.
+        
+        ### Основные возможности:
+        - 📖 Управление книгами (CRUD операции)
+        - 👨‍💼 Управление авторами
+        - 🔍 Поиск книг по названию
+        - 📄 Пагинация для больших списков
+        - ✅ Валидация данных
+        
+        ### Примеры использования:
+        
+        **Создание автора:**
+        ```json
+        {
+          "name": "Лев Толстой",
+          "bio": "Русский писатель",
+          "birth_date": "1828-09-09"
+        }
+        ```
+        
+        **Создание книги:**
+        ```json
+        {
+          "title": "Война и мир",
+          "author_id": 1,
+          "description": "Роман-эпопея",
+          "year": 1869,
+          "isbn": "9781234567890"
+        }
+        ```
+        """,
+        routes=app.routes,
+    )
+    
+    # Кастомизация схемы OpenAPI для лучшего отображения в ReDoc
+    openapi_schema["info"]["contact"] = {
+        "name": "Поддержка API",
+        "email": "support@library.com",
+    }
+    openapi_schema["info"]["license"] = {
+        "name": "MIT",
+        "url": "https://opensource.org/licenses/MIT",
+    }
+    
+    # Добавляем теги для группировки endpoint-ов
+    openapi_schema["tags"] = [
+        {
+            "name": "books",
+            "description": "Операции с книгами: создание, чтение, обновление, удаление книг"
+        },
+        {
+            "name": "authors", 
+            "description": "Операции с авторами: создание, чтение, получение книг автора"
+        },
+        {
+            "name": "search",
+            "description": "Поисковые операции"
+        },
+        {
+            "name": "health",
+            "description": "Проверка работоспособности API"
+        }
+    ]
+    
+    app.openapi_schema = openapi_schema
+    return app.openapi_schema
+
+# Верхняя граница размера страницы для списков с курсорной пагинацией
+MAX_PAGE_SIZE = 1000
+
+# Списки сериализуются одним вызовом pydantic-core вместо response_model
+book_list_adapter = TypeAdapter(List[BookResponse])
+book_list_item_adapter = TypeAdapter(List[BookListItem])
+author_list_item_adapter = TypeAdapter(List[AuthorListItem])
+
+def serialize_list(adapter: TypeAdapter, rows):
+    return adapter.dump_python(adapter.validate_python(rows, from_attributes=True))
+
+# Уникальность ISBN проверяет БД: отдельный SELECT перед вставкой не нужен
+ISBN_CONFLICT_RESPONSE = {409: {"description": "Книга с таким ISBN уже существует"}}
+
+# SQLSTATE PostgreSQL и расширенные коды ошибок SQLite
+UNIQUE_VIOLATIONS = {"23505", "SQLITE_CONSTRAINT_UNIQUE"}
+FOREIGN_KEY_VIOLATIONS = {"23503", "SQLITE_CONSTRAINT_FOREIGNKEY"}
+NOT_NULL_VIOLATIONS = {"23502", "SQLITE_CONSTRAINT_NOTNULL"}
+
+def book_integrity_error(error: IntegrityError) -> Optional[HTTPException]:
+    code = getattr(error.orig, "sqlstate", None) or getattr(error.orig, "sqlite_errorname", None)
+    if code in UNIQUE_VIOLATIONS:
+        # Единственное уникальное поле книги, задаваемое клиентом, — isbn
+        return HTTPException(status_code=409, detail="Book with this ISBN already exists")
+    if code in FOREIGN_KEY_VIOLATIONS:
+        return HTTPException(status_code=422, detail="Author not found")
+    if code in NOT_NULL_VIOLATIONS:
+        # BookUpdate допускает явный null, но title и author_id обязательны
+        return HTTPException(status_code=422, detail="Required book field cannot be null")
+    return None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Схемой управляют миграции Alembic; при старте только проверяем доступность БД
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    redis = init_cache()
+    yield
+    await redis.close()
+    await engine.dispose()
+
+app = FastAPI(
+    title="Library Management API",
+    version="1.0.0",
+    description="📚 REST API для системы управления библиотекой книг",
+    docs_url="/docs",  # URL для Swagger UI
+    redoc_url="/redoc",  # URL для ReDoc
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+app.openapi = custom_openapi
+
+# CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# ETag/Cache-Control для чтения книг и авторов; max_age совпадает с TTL кэша Redis
+app.add_middleware(ETagMiddleware, paths=("/books", "/authors"), max_age=30)
+
+@app.get("/health", tags=["health"])
+async def health_check():
+    """
+    Проверка статуса API
+    
+    Возвращает текущий статус работы API системы управления библиотекой.
+    """
+    return {"status": "healthy", "message": "API is running successfully"}
+
+# Book endpoints
+@app.get("/books", responses={200: {"model": BookPage}}, tags=["books"])
+@cache(expire=30, namespace=BOOKS_NAMESPACE, key_builder=list_key_builder)
+async def read_books(
+    cursor: Optional[str] = None, 
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE), 
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Получить список всех книг
+    
+    - **cursor**: Курсор следующей страницы из поля `next_cursor` предыдущего ответа (пагинация)
+    - **limit**: Максимальное количество записей для возврата, от 1 до 1000 (пагинация)
+    
+    Возвращает страницу книг, упорядоченных по ID, и курсор следующей страницы
+    (`next_cursor` равен `null` на последней странице).
+    Описание книги в списке не возвращается — полная запись доступна
+    по `GET /books/{book_id}`.
+    """
+    try:
+        books, next_cursor = await get_books(db, cursor=cursor, limit=limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return ORJSONResponse(
+        {"data": serialize_list(book_list_item_adapter, books), "next_cursor": next_cursor}
+    )
+
+@app.get("/books/{book_id}", response_model=BookResponse, tags=["books"])
+@cache(expire=30, namespace=BOOKS_NAMESPACE, key_builder=book_key_builder)
+async def read_book(book_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Получить информацию о конкретной книге
+    
+    - **book_id**: ID книги (целое число)
+    
+    Возвращает полную информацию о книге по её ID.
+    """
+    db_book = await get_book(db, book_id)
+    if db_book is None:
+        raise HTTPException(status_code=404, detail="Book not found")
+    return BookResponse.model_validate(db_book)
+
+@app.post(
+    "/books",
+    response_model=BookResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses=ISBN_CONFLICT_RESPONSE,
+    tags=["books"],
+)
+async def add_book(book: BookCreate, db: AsyncSession = Depends(get_db)):
+    """
+    Добавить новую книгу
+    
+    Создает новую запись книги в библиотеке.
+    
+    **Обязательные поля:**
+    - title: Название книги
+    - author_id: ID автора (для несуществующего автора возвращается 422)
+    
+    **Опциональные поля:**
+    - description: Описание книги
+    - year: Год издания
+    - isbn: ISBN номер (уникальный, при повторе возвращается 409)
+    """
+    try:
+        return await create_book(db, book)
+    except IntegrityError as error:
+        await db.rollback()
+        http_error = book_integrity_error(error)
+        if http_error is None:
+            raise
+        raise http_error from error
+
+@app.post(
+    "/books:bulk",
+    responses={201: {"model": List[BookResponse]}, **ISBN_CONFLICT_RESPONSE},
+    status_code=status.HTTP_201_CREATED,
+    tags=["books"],
+)
+async def add_books_bulk(books: List[BookCreate], db: AsyncSession = Depends(get_db)):
+    """
+    Добавить несколько книг одним запросом
+    
+    Принимает массив книг в том же формате, что и `POST /books`, и создает их
+    одной вставкой в одной транзакции. Предназначен для импорта каталога.
+    
+    Возвращает созданные книги в порядке передачи.
+    """
+    try:
+        db_books = await create_books_bulk(db, books)
+    except IntegrityError as error:
+        await db.rollback()
+        http_error = book_integrity_error(error)
+        if http_error is None:
+            raise
+        raise http_error from error
+    return ORJSONResponse(
+        serialize_list(book_list_adapter, db_books),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+@app.put("/books/{book_id}", response_model=BookResponse, responses=ISBN_CONFLICT_RESPONSE, tags=["books"])
+async def update_book_info(
+    book_id: int, 
+    book: BookUpdate, 
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Обновить информацию о книге
+    
+    - **book_id**: ID книги для обновления
+    - **book**: Данные для обновления (только изменяемые поля)
+    
+    Обновляет информацию о существующей книге. Можно передавать только те поля, которые нужно изменить.
+    """
+    try:
+        db_book = await update_book(db, book_id, book)
+    except IntegrityError as error:
+        await db.rollback()
+        http_error = book_integrity_error(error)
+        if http_error is None:
+            raise
+        raise http_error from error
+    if db_book is None:
+        raise HTTPException(status_code=404, detail="Book not found")
+    return db_book
+
+@app.delete("/books/{book_id}", tags=["books"])
+async def remove_book(book_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Удалить книгу
+    
+    - **book_id**: ID книги для удаления
+    
+    Удаляет книгу из библиотеки по указанному ID.
+    """
+    success = await delete_book(db, book_id)
+    if not success:
+        raise HTTPException(status_code=404, detail="Book not found")
+    return {"message": "Book deleted successfully"}
+
+# Author endpoints
+@app.get("/authors", responses={200: {"model": AuthorPage}}, tags=["authors"])
+@cache(expire=30, namespace=AUTHORS_NAMESPACE, key_builder=list_key_builder)
+async def read_authors(
+    cursor: Optional[str] = None, 
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE), 
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Получить список авторов
+    
+    - **cursor**: Курсор следующей страницы из поля `next_cursor` предыдущего ответа (пагинация)
+    - **limit**: Максимальное количество записей для возврата, от 1 до 1000 (пагинация)
+    
+    Возвращает страницу авторов, упорядоченных по ID, и курсор следующей страницы
+    (`next_cursor` равен `null` на последней странице).
+    Биография автора в списке не возвращается.
+    """
+    try:
+        authors, next_cursor = await get_authors(db, cursor=cursor, limit=limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return ORJSONResponse(
+        {"data": serialize_list(author_list_item_adapter, authors), "next_cursor": next_cursor}
+    )
+
+@app.get("/authors/{author_id}/books", responses={200: {"model": List[BookResponse]}}, tags=["authors"])
+@cache(expire=30, namespace=BOOKS_NAMESPACE, key_builder=author_books_key_builder)
+async def read_author_books(author_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Получить книги конкретного автора
+    
+    - **author_id**: ID автора
+    
+    Возвращает список всех книг, написанных указанным автором
+    (пустой список, если книг у автора нет).
+    """
+    books = await get_author_books(db, author_id)
+    if books is None:
+        raise HTTPException(status_code=404, detail="Author not found")
+    return ORJSONResponse(serialize_list(book_list_adapter, books))
+
+@app.post("/authors", response_model=AuthorResponse, status_code=status.HTTP_201_CREATED, tags=["authors"])
+async def add_author(author: AuthorCreate, db: AsyncSession = Depends(get_db)):
+    """
+    Добавить нового автора
+    
+    Создает новую запись автора в системе.
+    
+    **Обязательные поля:**
+    - name: Имя автора
+    
+    **Опциональные поля:**
+    - bio: Биография автора
+    - birth_date: Дата рождения
+    """
+    return await create_author(db, author)
+
+# Search endpoint
+@app.get("/books/search/{title}", responses={200: {"model": List[BookResponse]}}, tags=["search"])
+@cache(expire=30, namespace=BOOKS_NAMESPACE, key_builder=search_key_builder)
+async def search_books(
+    title: str = Path(..., max_length=64), 
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Поиск книг по названию
+    
+    - **title**: Фрагмент названия книги для поиска (не длиннее 64 символов)
+    
+    Возвращает список книг, в названии которых содержится указанный фрагмент.
+    Поиск не чувствителен к регистру.
+    
+    Если ничего не найдено, возвращается пустой список.
+    
+    **Пример:** поиск "война" найдет "Война и мир", "Война миров" и т.д.
+    """
+    books = await search_books_by_title(db, title)
+    return ORJSONResponse(serialize_list(book_list_adapter, books))
+
+# Маршруты не меняются после старта, поэтому Markdown генерируется один раз
+markdown_docs: Optional[str] = None
+
+@app.get("/docs/markdown", include_in_schema=False)
+async def get_markdown_docs():
+    """Генерирует Markdown документацию API"""
+    global markdown_docs
+    if markdown_docs is None:
+        markdown_docs = render_markdown_docs()
+    return Response(content=markdown_docs, media_type="text/markdown")
+
+def render_markdown_docs():
+    openapi_schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        description=app.description,
+        routes=app.routes,
+    )
+    
+    markdown_content = f"# {openapi_schema['info']['title']}\n\n"
+    markdown_content += f"**Версия**: {openapi_schema['info']['version']}\n\n"
+    markdown_content += f"**Описание**: {openapi_schema['info']['description']}\n\n"
+    
+    # Добавляем информацию о endpoint-ах
+    for path, methods in openapi_schema['paths'].items():
+        for method, details in methods.items():
+            markdown_content += f"## {method.upper()} {path}\n\n"
+            markdown_content += f"**Описание**: {details.get('summary', '')}\n\n"
+            if 'parameters' in details:
+                markdown_content += "**Параметры**:\n"
+                for param in details['parameters']:
+                    markdown_content += f"- `{param['name']}` ({param['in']}): {param.get('description', '')}\n"
+                markdown_content += "\n"
+
+    return markdown_content
+
+
+@app.get("/docs/html")
+async def get_html_docs():
+    """Генерирует HTML документацию API"""
+    return FileResponse("./templates/schema.html")
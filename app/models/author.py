@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, Text, Date, DateTime
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from ..database.session import Base
+from ..database.base import Base
 
 class Author(Base):
     __tablename__ = "authors"
@@ -12,4 +12,4 @@ class Author(Base):
     birth_date = Column(Date)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    books = relationship("Book", back_populates="author")
\ No newline at end of file
+    books = relationship("Book", back_populates="author", lazy="raise")
\ No newline at end of file
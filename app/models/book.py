@@ -1,10 +1,21 @@
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from ..database.session import Base
+from ..database.base import Base
 
 class Book(Base):
     __tablename__ = "books"
+    __table_args__ = (
+        # Покрывает выборку книг автора с сортировкой по id
+        Index("ix_books_author_id_id", "author_id", "id"),
+        # Триграммный GIN-индекс обслуживает ILIKE '%...%' и оператор похожести %
+        Index(
+            "books_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False, index=True)
@@ -14,4 +25,4 @@ class Book(Base):
     isbn = Column(String(13), unique=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    author = relationship("Author", back_populates="books")
\ No newline at end of file
+    author = relationship("Author", back_populates="books", lazy="raise")
\ No newline at end of file
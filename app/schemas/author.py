@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 
 class AuthorBase(BaseModel):
     name: str
@@ -14,5 +14,17 @@ class AuthorResponse(AuthorBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class AuthorListItem(BaseModel):
+    """Автор в списке: без bio, которая не читается из БД"""
+    id: int
+    name: str
+    birth_date: Optional[date] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class AuthorPage(BaseModel):
+    data: List[AuthorListItem]
+    next_cursor: Optional[str] = None
@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class BookBase(BaseModel):
     title: str
@@ -23,5 +23,19 @@ class BookResponse(BookBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+class BookListItem(BaseModel):
+    """Книга в списке: без description, который не читается из БД"""
+    id: int
+    title: str
+    author_id: int
+    year: Optional[int] = None
+    isbn: Optional[str] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class BookPage(BaseModel):
+    data: List[BookListItem]
+    next_cursor: Optional[str] = None
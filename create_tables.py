@@ -1,7 +1,12 @@
-from app.database.session import engine, Base
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+ALEMBIC_INI = Path(__file__).resolve().parent / "alembic.ini"
 
 def create_tables():
-    Base.metadata.create_all(bind=engine)
+    command.upgrade(Config(str(ALEMBIC_INI)), "head")
     print("Таблицы успешно созданы!")
 
 if __name__ == "__main__":
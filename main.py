@@ -1,4 +1,20 @@
+import os
+import sys
+
 import uvicorn
 
+# uvloop не поддерживает Windows, там остается стандартный цикл asyncio
+LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+WORKERS = int(os.getenv("WEB_CONCURRENCY", "1"))
+
 if __name__ == "__main__":
-    uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop=LOOP,
+        http="httptools",
+        workers=WORKERS,
+        # Автоперезагрузка несовместима с несколькими воркерами
+        reload=WORKERS == 1,
+    )
\ No newline at end of file
@@ -0,0 +1,72 @@
+import asyncio
+from logging.config import fileConfig
+
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from alembic import context
+
+from app.database.base import SQLALCHEMY_DATABASE_URL, Base
+from app.models import author, book  # noqa: F401  регистрирует таблицы в Base.metadata
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# Индексы, которые создаются только в PostgreSQL (ddl_if); на других СУБД
+# autogenerate не должен считать их отсутствие расхождением со схемой
+POSTGRESQL_ONLY_INDEXES = {"books_title_trgm"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "index" and name in POSTGRESQL_ONLY_INDEXES:
+        return context.get_context().dialect.name == "postgresql"
+    return True
+
+
+def run_migrations_offline() -> None:
+    """Генерирует SQL миграций без подключения к БД (alembic upgrade --sql)"""
+    context.configure(
+        url=SQLALCHEMY_DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    connectable = create_async_engine(SQLALCHEMY_DATABASE_URL, poolclass=pool.NullPool)
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
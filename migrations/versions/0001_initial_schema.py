@@ -0,0 +1,78 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+
+    op.create_table(
+        "authors",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("bio", sa.Text(), nullable=True),
+        sa.Column("birth_date", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_authors_id", "authors", ["id"])
+    op.create_index("ix_authors_name", "authors", ["name"])
+
+    op.create_table(
+        "books",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("author_id", sa.Integer(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("year", sa.Integer(), nullable=True),
+        sa.Column("isbn", sa.String(length=13), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["author_id"], ["authors.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_books_id", "books", ["id"])
+    op.create_index("ix_books_title", "books", ["title"])
+    op.create_index("ix_books_isbn", "books", ["isbn"], unique=True)
+    op.create_index("ix_books_author_id_id", "books", ["author_id", "id"])
+
+    if is_postgresql:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "books_title_trgm",
+            "books",
+            ["title"],
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("books_title_trgm", table_name="books")
+
+    op.drop_index("ix_books_author_id_id", table_name="books")
+    op.drop_index("ix_books_isbn", table_name="books")
+    op.drop_index("ix_books_title", table_name="books")
+    op.drop_index("ix_books_id", table_name="books")
+    op.drop_table("books")
+
+    op.drop_index("ix_authors_name", table_name="authors")
+    op.drop_index("ix_authors_id", table_name="authors")
+    op.drop_table("authors")